@@ -8,11 +8,16 @@ import os
 import json
 from pathlib import Path
 import re
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from itertools import groupby, islice
+from operator import itemgetter
+from typing import NamedTuple, Optional
 
 def create_base_styles():
     """Create the base CSS styles for slides"""
     return '''
-    <style>
         * {
             margin: 0;
             padding: 0;
@@ -162,6 +167,16 @@ def create_base_styles():
             margin: 10px 0;
         }
         
+        .section-badge {
+            background: #e74c3c;
+            color: white;
+            padding: 5px 15px;
+            border-radius: 20px;
+            display: inline-block;
+            margin-bottom: 20px;
+            font-size: 0.9em;
+        }
+        
         @media (max-width: 768px) {
             .slide-container {
                 padding: 20px;
@@ -181,202 +196,273 @@ def create_base_styles():
                 font-size: 0.8em;
             }
         }
-    </style>
     '''
 
-def create_slide_template(title, content, section=None):
-    """Create a basic slide HTML template"""
-    section_badge = ""
-    if section:
-        section_badge = f'<div style="background: #e74c3c; color: white; padding: 5px 15px; border-radius: 20px; display: inline-block; margin-bottom: 20px; font-size: 0.9em;">{section}</div>'
-    
-    return f'''<!DOCTYPE html>
+def minify_css(styles):
+    """Strip indentation and line breaks from a CSS block"""
+    return re.sub(r'\s*\n\s*', '', styles)
+
+# Minified once at import and written to a single stylesheet that every
+# slide links to, instead of being embedded in each slide file
+BASE_STYLES = minify_css(create_base_styles())
+STYLESHEET_FILENAME = 'styles.css'
+
+# The slide skeleton is split around the per-slide fields, with the
+# stylesheet link filled in once here rather than on every slide
+SLIDE_HEAD_TEMPLATE = '''<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>{title}</title>
-    {create_base_styles()}
+    <link rel="stylesheet" href="''' + STYLESHEET_FILENAME + '''">
 </head>
 <body>
     <div class="slide-container">
-        {section_badge}
-        {content}
+        '''
+SLIDE_TAIL = '''
     </div>
 </body>
 </html>'''
 
-def discover_slides(slides_dir):
-    """Discover all slide files and extract metadata"""
-    slides = []
-    slide_pattern = re.compile(r'^(\d{3})-(.+)\.html$')
+SECTION_BADGE_TEMPLATE = '<div class="section-badge">{section}</div>'
+
+# Heads specialized for slides with and without a section badge
+SLIDE_HEAD_NO_SECTION_TEMPLATE = SLIDE_HEAD_TEMPLATE + '\n        '
+SLIDE_HEAD_SECTION_TEMPLATE = SLIDE_HEAD_TEMPLATE + SECTION_BADGE_TEMPLATE + '\n        '
+
+def create_slide_template(title, content, section=None):
+    """Create a basic slide HTML template"""
+    if section:
+        head = SLIDE_HEAD_SECTION_TEMPLATE.format(title=title, section=section)
+    else:
+        head = SLIDE_HEAD_NO_SECTION_TEMPLATE.format(title=title)
     
-    # Get all HTML files that match the pattern
-    html_files = [f for f in os.listdir(slides_dir) if f.endswith('.html') and f != 'index.html']
-    html_files.sort()  # Sort by filename
+    return head + content + SLIDE_TAIL
+
+# Compiled once and shared by every discover_slides() call
+SLIDE_PATTERN = re.compile(r'^(\d{3})-(.+)\.html$')
+SLUG_TO_WORDS = str.maketrans('-', ' ')
+
+# Slides numbered up to 010 are 'Main', 011+ are 'Appendix'
+MAIN_SLIDE_NUMBERS = frozenset(f'{i:03d}' for i in range(11))
+
+# Slides from create_slide_template() have their <title> and section badge
+# within the first couple of KB, so discovery reads in chunks of this size
+HEAD_READ_SIZE = 2048
+
+# The section badge directly follows the container's opening tag, so
+# discovery stops reading this far past it
+SLIDE_CONTAINER_TAG = '<div class="slide-container"'
+SECTION_BADGE_WINDOW = 512
+
+def extract_title(content):
+    """Return the slide title from a '<title>NNN - Title</title>' tag, or None"""
+    start = content.find('<title>')
+    if start == -1:
+        return None
+    start += len('<title>')
+    end = content.find('</title>', start)
+    if end == -1:
+        return None
     
-    for filename in html_files:
-        match = slide_pattern.match(filename)
-        if match:
-            number = match.group(1)
-            title_slug = match.group(2)
-            
-            # Convert slug back to title
-            title = title_slug.replace('-', ' ').replace('and', '&').title()
-            
-            # Read the file to extract actual title and section
-            filepath = slides_dir / filename
-            try:
-                with open(filepath, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                    
-                # Extract title from HTML
-                title_match = re.search(r'<title>.*?-\s*(.+?)</title>', content)
-                if title_match:
-                    title = title_match.group(1)
-                
-                # Check if it's an appendix slide
-                section = "Appendix" if "Appendix" in content else "Main"
+    _, dash, title = content[start:end].partition('-')
+    title = title.lstrip()
+    return title if dash and title else None
+
+def write_if_changed(filepath, text):
+    """Write text to filepath unless the file already holds it; return True if written"""
+    data = text.encode('utf-8')
+    try:
+        # Cheap size check first, compare contents only on a size match
+        if os.path.getsize(filepath) == len(data):
+            with open(filepath, 'rb') as f:
+                if f.read() == data:
+                    return False
+    except FileNotFoundError:
+        pass
+    
+    # Write to a temp file and swap it in so readers never see a partial file
+    tmp_filepath = f"{filepath}.tmp"
+    with open(tmp_filepath, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_filepath, filepath)
+    return True
+
+def write_stylesheet(slides_dir):
+    """Write the shared slide stylesheet next to the slides"""
+    write_if_changed(slides_dir / STYLESHEET_FILENAME, BASE_STYLES)
+
+def scan_html_files(slides_dir):
+    """Return sorted (filename, path) pairs for the HTML files in slides_dir"""
+    with os.scandir(slides_dir) as entries:
+        html_files = [
+            (entry.name, entry.path) for entry in entries
+            if entry.name.endswith('.html') and entry.name != 'index.html' and entry.is_file()
+        ]
+    html_files.sort()  # Sort by filename
+    return html_files
+
+def read_slide_metadata(filename, filepath):
+    """Extract metadata from a single slide file, or None if it isn't a slide"""
+    match = SLIDE_PATTERN.match(filename)
+    if match:
+        number = match.group(1)
+        title_slug = match.group(2)
+        
+        # Convert slug back to title, turning only whole-word 'and' into '&'
+        words = title_slug.translate(SLUG_TO_WORDS).split()
+        title = ' '.join('&' if word == 'and' else word.capitalize() for word in words)
+        
+        # Read the file to extract actual title and section
+        try:
+            with open(filepath, 'r', encoding='utf-8') as f:
+                content = f.read(HEAD_READ_SIZE)
                 
-                slides.append({
-                    'number': number,
-                    'title': title,
-                    'filename': filename,
-                    'section': section
-                })
+                # Keep reading until the section badge window past the
+                # container's opening tag is covered (e.g. long inline <style>)
+                body_start = content.find(SLIDE_CONTAINER_TAG)
+                while body_start < 0 or len(content) < body_start + SECTION_BADGE_WINDOW:
+                    chunk = f.read(HEAD_READ_SIZE)
+                    if not chunk:
+                        break
+                    content += chunk
+                    if body_start < 0:
+                        body_start = content.find(SLIDE_CONTAINER_TAG)
                 
-            except Exception as e:
-                print(f"Warning: Could not read {filename}: {e}")
-                # Fallback to derived info
-                slides.append({
-                    'number': number,
-                    'title': title,
-                    'filename': filename,
-                    'section': "Appendix" if int(number) > 10 else "Main"
-                })
+            # Extract title from HTML
+            title = extract_title(content) or title
+            
+            # Check if it's an appendix slide
+            section = "Appendix" if "Appendix" in content else "Main"
+            
+            return {
+                'number': number,
+                'title': title,
+                'filename': filename,
+                'section': section
+            }
+            
+        except Exception as e:
+            print(f"Warning: Could not read {filename}: {e}")
+            # Fallback to derived info
+            return {
+                'number': number,
+                'title': title,
+                'filename': filename,
+                'section': "Main" if number in MAIN_SLIDE_NUMBERS else "Appendix"
+            }
     
-    return slides
+    return None
 
-def create_navigation_html(slides, slides_dir):
-    """Create the main navigation HTML"""
-    # Create sidebar items
-    sidebar_items = []
-    current_section = None
-    
-    for i, slide in enumerate(slides):
-        section = slide['section']
-        
-        if section != current_section:
-            if current_section is not None:
-                sidebar_items.append('</div>')
-            sidebar_items.append(f'<div class="section"><h3>{section}</h3>')
-            current_section = section
-        
-        active_class = "active" if i == 0 else ""
-        sidebar_items.append(f'''
-            <div class="slide-item {active_class}" onclick="loadSlide('{slide["filename"]}', {i})">
-                {slide["number"]}. {slide["title"]}
-            </div>
-        ''')
-    
-    if current_section is not None:
-        sidebar_items.append('</div>')
-    
-    sidebar_html = ''.join(sidebar_items)
-    
-    # Get first slide filename for initial load
-    first_slide = slides[0]['filename'] if slides else 'index.html'
+def discover_slides(slides_dir, html_files=None):
+    """Discover all slide files and extract metadata"""
+    # Get all HTML files that match the pattern, unless the caller already
+    # scanned the directory
+    if html_files is None:
+        html_files = scan_html_files(slides_dir)
+    if not html_files:
+        return []
     
-    return f'''<!DOCTYPE html>
+    # Reading slides is I/O bound, so overlap the file reads across threads;
+    # map() returns the results in filename order
+    with ThreadPoolExecutor(max_workers=min(32, len(html_files))) as executor:
+        results = executor.map(lambda html_file: read_slide_metadata(*html_file), html_files)
+        return [slide for slide in results if slide is not None]
+
+# Static parts of the navigation page, kept as plain strings so the CSS and
+# JavaScript need no brace escaping; create_navigation_html() joins them
+# around the per-deck sidebar, counters and slide list
+NAVIGATION_HEAD = '''<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>Prefect Slide Deck</title>
     <style>
-        * {{
+        * {
             margin: 0;
             padding: 0;
             box-sizing: border-box;
-        }}
+        }
         
-        body {{
+        body {
             font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
             background: #f5f6fa;
             height: 100vh;
             overflow: hidden;
-        }}
+        }
         
-        .container {{
+        .container {
             display: flex;
             height: 100vh;
-        }}
+        }
         
-        .sidebar {{
+        .sidebar {
             width: 300px;
             background: #2c3e50;
             color: white;
             overflow-y: auto;
             padding: 20px 0;
-        }}
+        }
         
-        .sidebar h2 {{
+        .sidebar h2 {
             text-align: center;
             padding: 0 20px 20px 20px;
             border-bottom: 2px solid #34495e;
             margin-bottom: 20px;
             color: #ecf0f1;
-        }}
+        }
         
-        .section h3 {{
+        .section h3 {
             background: #34495e;
             padding: 10px 20px;
             margin: 10px 0 5px 0;
             font-size: 0.9em;
             text-transform: uppercase;
             letter-spacing: 1px;
-        }}
+        }
         
-        .slide-item {{
+        .slide-item {
             padding: 12px 20px;
             cursor: pointer;
             transition: background-color 0.3s;
             border-left: 4px solid transparent;
             font-size: 0.9em;
-        }}
+        }
         
-        .slide-item:hover {{
+        .slide-item:hover {
             background: #34495e;
-        }}
+        }
         
-        .slide-item.active {{
+        .slide-item.active {
             background: #3498db;
             border-left-color: #2980b9;
             font-weight: 600;
-        }}
+        }
         
-        .main-content {{
+        .main-content {
             flex: 1;
             display: flex;
             flex-direction: column;
-        }}
+        }
         
-        .slide-frame {{
+        .slide-frame {
             flex: 1;
             border: none;
             background: white;
-        }}
+        }
         
-        .navigation {{
+        .navigation {
             background: white;
             padding: 15px 30px;
             border-top: 1px solid #ddd;
             display: flex;
             justify-content: center;
             gap: 15px;
-        }}
+        }
         
-        .nav-btn {{
+        .nav-btn {
             background: #3498db;
             color: white;
             border: none;
@@ -386,58 +472,60 @@ def create_navigation_html(slides, slides_dir):
             font-size: 16px;
             font-weight: 600;
             transition: background-color 0.3s;
-        }}
+        }
         
-        .nav-btn:hover:not(:disabled) {{
+        .nav-btn:hover:not(:disabled) {
             background: #2980b9;
-        }}
+        }
         
-        .nav-btn:disabled {{
+        .nav-btn:disabled {
             background: #bdc3c7;
             cursor: not-allowed;
-        }}
+        }
         
-        .slide-counter {{
+        .slide-counter {
             background: #ecf0f1;
             padding: 10px 20px;
             text-align: center;
             color: #2c3e50;
             font-weight: 600;
             border-bottom: 1px solid #ddd;
-        }}
+        }
         
-        @media (max-width: 768px) {{
-            .container {{
+        @media (max-width: 768px) {
+            .container {
                 flex-direction: column;
-            }}
+            }
             
-            .sidebar {{
+            .sidebar {
                 width: 100%;
                 height: 200px;
-            }}
+            }
             
-            .navigation {{
+            .navigation {
                 padding: 10px 15px;
                 gap: 10px;
-            }}
+            }
             
-            .nav-btn {{
+            .nav-btn {
                 padding: 8px 15px;
                 font-size: 14px;
-            }}
-        }}
+            }
+        }
     </style>
 </head>
 <body>
     <div class="container">
         <div class="sidebar">
             <h2>🚀 Prefect Slides</h2>
-            {sidebar_html}
+            '''
+
+NAVIGATION_CONTROLS_TEMPLATE = '''
         </div>
         
         <div class="main-content">
             <div class="slide-counter">
-                <span id="current-slide">1</span> / {len(slides)}
+                <span id="current-slide">1</span> / {total}
             </div>
             
             <iframe id="slide-frame" class="slide-frame" src="{first_slide}"></iframe>
@@ -446,58 +534,60 @@ def create_navigation_html(slides, slides_dir):
                 <button class="nav-btn" id="first-btn" onclick="goToSlide(0)">&lt;&lt;</button>
                 <button class="nav-btn" id="prev-btn" onclick="previousSlide()">&lt;</button>
                 <button class="nav-btn" id="next-btn" onclick="nextSlide()">&gt;</button>
-                <button class="nav-btn" id="last-btn" onclick="goToSlide({len(slides) - 1})">&gt;&gt;</button>
+                <button class="nav-btn" id="last-btn" onclick="goToSlide({last_index})">&gt;&gt;</button>
             </div>
         </div>
     </div>
     
     <script>
-        const slides = {json.dumps([slide['filename'] for slide in slides])};
+        const slides = '''
+
+NAVIGATION_SCRIPT = ''';
         let currentSlideIndex = 0;
         
-        function loadSlide(filename, index) {{
+        function loadSlide(filename, index) {
             document.getElementById('slide-frame').src = filename;
             currentSlideIndex = index;
             updateUI();
-        }}
+        }
         
-        function updateUI() {{
+        function updateUI() {
             // Update slide counter
             document.getElementById('current-slide').textContent = currentSlideIndex + 1;
             
             // Update active sidebar item
-            document.querySelectorAll('.slide-item').forEach((item, index) => {{
+            document.querySelectorAll('.slide-item').forEach((item, index) => {
                 item.classList.toggle('active', index === currentSlideIndex);
-            }});
+            });
             
             // Update navigation buttons
             document.getElementById('first-btn').disabled = currentSlideIndex === 0;
             document.getElementById('prev-btn').disabled = currentSlideIndex === 0;
             document.getElementById('next-btn').disabled = currentSlideIndex === slides.length - 1;
             document.getElementById('last-btn').disabled = currentSlideIndex === slides.length - 1;
-        }}
+        }
         
-        function goToSlide(index) {{
-            if (index >= 0 && index < slides.length) {{
+        function goToSlide(index) {
+            if (index >= 0 && index < slides.length) {
                 loadSlide(slides[index], index);
-            }}
-        }}
+            }
+        }
         
-        function nextSlide() {{
-            if (currentSlideIndex < slides.length - 1) {{
+        function nextSlide() {
+            if (currentSlideIndex < slides.length - 1) {
                 goToSlide(currentSlideIndex + 1);
-            }}
-        }}
+            }
+        }
         
-        function previousSlide() {{
-            if (currentSlideIndex > 0) {{
+        function previousSlide() {
+            if (currentSlideIndex > 0) {
                 goToSlide(currentSlideIndex - 1);
-            }}
-        }}
+            }
+        }
         
         // Keyboard navigation
-        document.addEventListener('keydown', function(e) {{
-            switch(e.key) {{
+        document.addEventListener('keydown', function(e) {
+            switch(e.key) {
                 case 'ArrowLeft':
                     previousSlide();
                     break;
@@ -510,8 +600,8 @@ def create_navigation_html(slides, slides_dir):
                 case 'End':
                     goToSlide(slides.length - 1);
                     break;
-            }}
-        }});
+            }
+        });
         
         // Initialize
         updateUI();
@@ -519,46 +609,89 @@ def create_navigation_html(slides, slides_dir):
 </body>
 </html>'''
 
-def create_sample_slides(slides_dir):
-    """Create a few sample slides to demonstrate the structure"""
-    sample_slides = [
-        {
-            'number': '001',
-            'title': 'Introduction to Prefect',
-            'content': '''
-            <h1>🚀 Prefect</h1>
-            <h2>Modern Workflow Orchestration</h2>
-            <div class="slide-content">
-                <ul>
-                    <li><strong>What is Prefect?</strong> A modern workflow orchestration platform</li>
-                    <li><strong>Purpose:</strong> Build, run, and monitor data pipelines at scale</li>
-                    <li><strong>Philosophy:</strong> "Negative engineering" - eliminate workflow failures</li>
-                    <li><strong>Key Focus:</strong> Developer experience and operational simplicity</li>
-                </ul>
-                <div class="highlight-box">
-                    <p><em>"The easiest way to coordinate your data stack"</em></p>
-                </div>
+def create_navigation_html(slides, slides_dir):
+    """Create the main navigation HTML"""
+    # Create sidebar items, one section block per run of consecutive slides
+    # sharing a section (slides keep their file order)
+    sidebar_items = []
+    
+    for section, group in groupby(enumerate(slides), key=lambda item: item[1]['section']):
+        sidebar_items.append(f'<div class="section"><h3>{section}</h3>')
+        for i, slide in group:
+            active_class = "active" if i == 0 else ""
+            sidebar_items.append(f'''
+            <div class="slide-item {active_class}" onclick="loadSlide('{slide["filename"]}', {i})">
+                {slide["number"]}. {slide["title"]}
             </div>
-            '''
-        },
-        {
-            'number': '002',
-            'title': 'Quick Setup',
-            'content': '''
-            <h1>⚡ Quick Setup</h1>
-            <div class="slide-content">
-                <h3>1. Installation</h3>
-                <div class="code-block">
-                    <pre><code># Install Prefect
+        ''')
+        sidebar_items.append('</div>')
+    
+    sidebar_html = ''.join(sidebar_items)
+    
+    # Get first slide filename for initial load
+    first_slide = slides[0]['filename'] if slides else 'index.html'
+    
+    return ''.join((
+        NAVIGATION_HEAD,
+        sidebar_html,
+        NAVIGATION_CONTROLS_TEMPLATE.format(
+            total=len(slides),
+            first_slide=first_slide,
+            last_index=len(slides) - 1
+        ),
+        json.dumps(list(map(itemgetter('filename'), slides)), separators=(',', ':')),
+        NAVIGATION_SCRIPT
+    ))
+
+SLIDE_BODY_TEMPLATE = '''
+        {heading}
+        <div class="slide-content">{body}</div>
+        '''
+
+class Slide(NamedTuple):
+    """Definition of a slide to be rendered with create_slide_template()"""
+    number: str
+    title: str
+    heading: str
+    body: str
+    section: Optional[str] = None
+
+def iter_sample_slides():
+    """Yield the sample Slide definitions one at a time"""
+    yield Slide(
+        number='001',
+        title='Introduction to Prefect',
+        heading='<h1>🚀 Prefect</h1><h2>Modern Workflow Orchestration</h2>',
+        body='''
+            <ul>
+                <li><strong>What is Prefect?</strong> A modern workflow orchestration platform</li>
+                <li><strong>Purpose:</strong> Build, run, and monitor data pipelines at scale</li>
+                <li><strong>Philosophy:</strong> "Negative engineering" - eliminate workflow failures</li>
+                <li><strong>Key Focus:</strong> Developer experience and operational simplicity</li>
+            </ul>
+            <div class="highlight-box">
+                <p><em>"The easiest way to coordinate your data stack"</em></p>
+            </div>
+        '''
+    )
+
+    yield Slide(
+        number='002',
+        title='Quick Setup',
+        heading='<h1>⚡ Quick Setup</h1>',
+        body='''
+            <h3>1. Installation</h3>
+            <div class="code-block">
+                <pre><code># Install Prefect
 pip install prefect
 
 # Or with extras
 pip install "prefect[dev,kubernetes]"</code></pre>
-                </div>
-                
-                <h3>2. First Flow</h3>
-                <div class="code-block">
-                    <pre><code>from prefect import flow, task
+            </div>
+            
+            <h3>2. First Flow</h3>
+            <div class="code-block">
+                <pre><code>from prefect import flow, task
 
 @task
 def say_hello(name: str) -> str:
@@ -571,81 +704,101 @@ def hello_world():
 
 if __name__ == "__main__":
     hello_world()</code></pre>
-                </div>
             </div>
-            '''
-        },
-        {
-            'number': '011',
-            'title': 'Prefect vs Airflow',
-            'section': 'Appendix',
-            'content': '''
-            <h1>🆚 Prefect vs Apache Airflow</h1>
-            <div class="slide-content">
-                <table class="comparison-table">
-                    <thead>
-                        <tr>
-                            <th>Aspect</th>
-                            <th>Prefect</th>
-                            <th>Apache Airflow</th>
-                        </tr>
-                    </thead>
-                    <tbody>
-                        <tr>
-                            <td><strong>Philosophy</strong></td>
-                            <td>Negative engineering, eliminate failures</td>
-                            <td>Workflow-as-code, maximum control</td>
-                        </tr>
-                        <tr>
-                            <td><strong>Dynamic Workflows</strong></td>
-                            <td>✅ Native support</td>
-                            <td>⚠️ Limited, requires workarounds</td>
-                        </tr>
-                        <tr>
-                            <td><strong>Learning Curve</strong></td>
-                            <td>🟢 Gentle, Pythonic</td>
-                            <td>🔴 Steep, many concepts</td>
-                        </tr>
-                    </tbody>
-                </table>
-            </div>
-            '''
-        }
-    ]
+        '''
+    )
+
+    yield Slide(
+        number='011',
+        title='Prefect vs Airflow',
+        section='Appendix',
+        heading='<h1>🆚 Prefect vs Apache Airflow</h1>',
+        body='''
+            <table class="comparison-table">
+                <thead>
+                    <tr>
+                        <th>Aspect</th>
+                        <th>Prefect</th>
+                        <th>Apache Airflow</th>
+                    </tr>
+                </thead>
+                <tbody>
+                    <tr>
+                        <td><strong>Philosophy</strong></td>
+                        <td>Negative engineering, eliminate failures</td>
+                        <td>Workflow-as-code, maximum control</td>
+                    </tr>
+                    <tr>
+                        <td><strong>Dynamic Workflows</strong></td>
+                        <td>✅ Native support</td>
+                        <td>⚠️ Limited, requires workarounds</td>
+                    </tr>
+                    <tr>
+                        <td><strong>Learning Curve</strong></td>
+                        <td>🟢 Gentle, Pythonic</td>
+                        <td>🔴 Steep, many concepts</td>
+                    </tr>
+                </tbody>
+            </table>
+        '''
+    )
+
+def write_sample_slide(slides_dir, slide):
+    """Render a single sample slide to disk and return its filename"""
+    filename = f"{slide.number}-{slide.title.lower().replace(' ', '-').replace('&', 'and')}.html"
+    filepath = os.path.join(slides_dir, filename)
     
-    for slide in sample_slides:
-        filename = f"{slide['number']}-{slide['title'].lower().replace(' ', '-').replace('&', 'and')}.html"
-        filepath = slides_dir / filename
-        
-        html_content = create_slide_template(
-            f"{slide['number']} - {slide['title']}", 
-            slide['content'],
-            slide.get('section')
-        )
-        
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write(html_content)
-        
-        print(f"Created sample slide: {filename}")
+    html_content = create_slide_template(
+        f"{slide.number} - {slide.title}", 
+        SLIDE_BODY_TEMPLATE.format(heading=slide.heading, body=slide.body),
+        slide.section
+    )
+    
+    write_if_changed(filepath, html_content)
+    
+    return filename
+
+# Same as ThreadPoolExecutor's default; also the number of sample slides
+# taken from iter_sample_slides() per batch
+SAMPLE_WRITE_WORKERS = min(32, (os.cpu_count() or 1) + 4)
+
+def create_sample_slides(slides_dir):
+    """Create a few sample slides to demonstrate the structure"""
+    # Slides are independent, so render and write them concurrently;
+    # map() still yields filenames in slide order for the log. Workers get
+    # the directory as a plain string rather than a Path per slide.
+    slides_dir = os.fspath(slides_dir)
+    write_slide = partial(write_sample_slide, slides_dir)
+    sample_slides = iter_sample_slides()
+    with ThreadPoolExecutor(max_workers=SAMPLE_WRITE_WORKERS) as executor:
+        # map() submits its whole iterable up front, so feed it one batch
+        # at a time to keep pulling slides from the generator lazily
+        batch = list(islice(sample_slides, SAMPLE_WRITE_WORKERS))
+        while batch:
+            for filename in executor.map(write_slide, batch):
+                print(f"Created sample slide: {filename}")
+            batch = list(islice(sample_slides, SAMPLE_WRITE_WORKERS))
 
 def generate_slide_deck():
     """Main function to generate navigation and discover slides"""
     slides_dir = Path("prefect_slides")
     slides_dir.mkdir(exist_ok=True)
+    write_stylesheet(slides_dir)
     
     # Check if slides exist, if not create samples
-    existing_slides = [f for f in os.listdir(slides_dir) if f.endswith('.html') and f != 'index.html']
+    html_files = scan_html_files(slides_dir)
     
-    if not existing_slides:
+    if not html_files:
         print("No slides found. Creating sample slides...")
         create_sample_slides(slides_dir)
+        html_files = scan_html_files(slides_dir)
     
-    # Discover all slides
-    slides = discover_slides(slides_dir)
+    # Discover all slides from the same directory scan
+    slides = discover_slides(slides_dir, html_files)
     
     if not slides:
         print("No valid slides found in the directory!")
-        return
+        return None, slides
     
     print(f"Discovered {len(slides)} slides:")
     for slide in slides:
@@ -655,34 +808,33 @@ def generate_slide_deck():
     index_filepath = slides_dir / "index.html"
     navigation_html = create_navigation_html(slides, slides_dir)
     
-    with open(index_filepath, 'w', encoding='utf-8') as f:
-        f.write(navigation_html)
-    
-    print(f"\nGenerated navigation: index.html")
+    if write_if_changed(index_filepath, navigation_html):
+        print(f"\nGenerated navigation: index.html")
+    else:
+        print(f"\nNavigation unchanged: index.html")
     print(f"Open {slides_dir}/index.html in your browser to view the presentation.")
     
-    return f"Generated navigation for {len(slides)} slides in '{slides_dir}' directory"
+    return f"Generated navigation for {len(slides)} slides in '{slides_dir}' directory", slides
 
-def save_slide_metadata(slides_dir):
+def save_slide_metadata(slides_dir, slides=None):
     """Save slide metadata to JSON for easy reference"""
-    slides = discover_slides(slides_dir)
+    # Reuse the slides from generate_slide_deck() when given
+    if slides is None:
+        slides = discover_slides(slides_dir)
+    
+    # Group by section
+    sections = defaultdict(list)
+    for slide in slides:
+        sections[slide['section']].append(slide)
     
     metadata = {
         'total_slides': len(slides),
         'slides': slides,
-        'sections': {}
+        'sections': dict(sections)
     }
     
-    # Group by section
-    for slide in slides:
-        section = slide['section']
-        if section not in metadata['sections']:
-            metadata['sections'][section] = []
-        metadata['sections'][section].append(slide)
-    
     metadata_file = slides_dir / 'slides_metadata.json'
-    with open(metadata_file, 'w', encoding='utf-8') as f:
-        json.dump(metadata, f, indent=2)
+    metadata_file.write_bytes(json.dumps(metadata, indent=2).encode('utf-8'))
     
     print(f"Saved metadata to: {metadata_file}")
 
@@ -690,11 +842,11 @@ if __name__ == "__main__":
     slides_dir = Path("prefect_slides")
     
     # Generate the navigation
-    result = generate_slide_deck()
+    result, slides = generate_slide_deck()
     print(result)
     
-    # Save metadata
-    save_slide_metadata(slides_dir)
+    # Save metadata for the slides just discovered
+    save_slide_metadata(slides_dir, slides)
     
     print("\n📋 Usage:")
     print("1. Add individual slide HTML files following the pattern: XXX-slide-title.html")
@@ -6,26 +6,80 @@ Generates navigation index from existing slide files with customizable options
 
 import os
 import json
+import importlib.util
 import click
 from pathlib import Path
 import re
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Iterator, Tuple
 import asyncio
 import tempfile
 import shutil
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from itertools import groupby
+from operator import itemgetter
 
-# Optional imports for PDF generation
-try:
-    from playwright.async_api import async_playwright
-    PLAYWRIGHT_AVAILABLE = True
-except ImportError:
-    PLAYWRIGHT_AVAILABLE = False
+# Optional PDF backends; only probe for them here, they are imported by the
+# PDF functions so plain `generate` and `--help` don't pay for loading them
+PLAYWRIGHT_AVAILABLE = importlib.util.find_spec('playwright') is not None
+WEASYPRINT_AVAILABLE = importlib.util.find_spec('weasyprint') is not None
 
+# Optional faster JSON encoder for the metadata file
 try:
-    import weasyprint
-    WEASYPRINT_AVAILABLE = True
+    import orjson
+    ORJSON_AVAILABLE = True
 except ImportError:
-    WEASYPRINT_AVAILABLE = False
+    ORJSON_AVAILABLE = False
+
+SLIDE_PATTERN = re.compile(r'^(\d{3})-(.+)\.html$')
+TITLE_PATTERN = re.compile(r'<title>[^-<]*-\s*([^<]+?)</title>')
+HEAD_READ_SIZE = 4096  # one page; covers <title> and usually the inline CSS
+SECTION_BADGE_WINDOW = 512  # the badge directly follows the container tag
+SLIDE_CONTAINER_TAG = '<div class="slide-container"'
+SLIDE_CONTAINER_TAG_BYTES = SLIDE_CONTAINER_TAG.encode('utf-8')
+SLIDE_BODY_START_BYTES = b'<!--SLIDE_BODY_START-->'
+SLIDE_BODY_END_BYTES = b'<!--SLIDE_BODY_END-->'
+ASCII_WHITESPACE = frozenset(b' \t\n\r\f\v')
+BODY_PATTERN = re.compile(r'<body[^>]*>(.*?)</body>', re.DOTALL)
+SLIDE_METADATA_FILENAME = 'slides_metadata.json'
+PDF_RENDER_WORKERS = min(4, os.cpu_count() or 1)  # browser contexts rendering slides at once
+
+# Headless Chromium only renders local HTML to PDF, so skip GPU setup,
+# the /dev/shm size limit, extensions and background network chatter
+CHROMIUM_LAUNCH_ARGS = [
+    '--disable-gpu',
+    '--disable-dev-shm-usage',
+    '--disable-extensions',
+    '--disable-background-networking',
+]
+
+# Markup that can make a slide load other files (images, media, stylesheets,
+# fonts); deliberately broad, a false positive only costs a file:// navigation
+EXTERNAL_ASSET_PATTERN = re.compile(rb'\b(?:src|srcset|href|poster|data)\s*=|\burl\s*\(|@import', re.IGNORECASE)
+
+# Screen-only effects that cost layout/paint time but never show in a PDF
+PDF_STYLE_OVERRIDES = '* { transition: none !important; animation: none !important; box-shadow: none !important; }'
+
+# Page setup shared by every slide rendered with WeasyPrint
+WEASYPRINT_BASE_STYLES = """
+    @page {
+        size: A4;
+        margin: 0.5in;
+    }
+    body {
+        font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
+        line-height: 1.6;
+        color: #333;
+    }
+"""
+
+# Title -> filename slug in one translate pass: spaces and path separators
+# become dashes, '&' is spelled out, and quotes (plain and typographic) and
+# characters Windows forbids in filenames are dropped
+SLUG_TABLE = str.maketrans({
+    ' ': '-', '/': '-', '\\': '-', '&': 'and',
+    **dict.fromkeys('\'"\u2018\u2019\u201c\u201d:?*<>|'),
+})
 
 def create_base_styles():
     """Create the base CSS styles for slides"""
@@ -202,126 +256,183 @@ def create_base_styles():
     </style>
     '''
 
-def create_slide_template(title: str, content: str, section: Optional[str] = None) -> str:
-    """Create a basic slide HTML template"""
-    section_badge = ""
-    if section:
-        section_badge = f'<div style="background: #e74c3c; color: white; padding: 5px 15px; border-radius: 20px; display: inline-block; margin-bottom: 20px; font-size: 0.9em;">{section}</div>'
-    
-    return f'''<!DOCTYPE html>
+BASE_STYLES = create_base_styles()
+
+# Slide page with the base styles spliced in once; their braces are escaped
+# so only {title}, {section_badge} and {content} remain as fields
+SLIDE_HTML_TEMPLATE = '''<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>{title}</title>
-    {create_base_styles()}
+    ''' + BASE_STYLES.replace('{', '{{').replace('}', '}}') + '''
 </head>
 <body>
-    <div class="slide-container">
+    <div class="slide-container"><!--SLIDE_BODY_START-->
         {section_badge}
-        {content}
+        {content}<!--SLIDE_BODY_END-->
     </div>
 </body>
 </html>'''
 
-def discover_slides(slides_dir: Path) -> List[Dict]:
-    """Discover all slide files and extract metadata"""
-    slides = []
-    slide_pattern = re.compile(r'^(\d{3})-(.+)\.html$')
-    
-    if not slides_dir.exists():
-        click.echo(f"❌ Directory {slides_dir} does not exist!", err=True)
-        return []
+# The page split around {content}, so callers can write the slide body as-is
+SLIDE_HTML_PREFIX_TEMPLATE, SLIDE_HTML_SUFFIX = SLIDE_HTML_TEMPLATE.split('{content}')
+SLIDE_HTML_SUFFIX_BYTES = SLIDE_HTML_SUFFIX.encode('utf-8')
+
+SECTION_BADGE_TEMPLATE = '<div style="background: #e74c3c; color: white; padding: 5px 15px; border-radius: 20px; display: inline-block; margin-bottom: 20px; font-size: 0.9em;">{section}</div>'
+
+# Slide heads specialized for slides with and without a section badge
+SLIDE_HEAD_NO_SECTION_TEMPLATE = SLIDE_HTML_PREFIX_TEMPLATE.replace('{section_badge}', '')
+SLIDE_HEAD_SECTION_TEMPLATE = SLIDE_HTML_PREFIX_TEMPLATE.replace('{section_badge}', SECTION_BADGE_TEMPLATE)
+
+def create_slide_head(title: str, section: Optional[str] = None) -> str:
+    """Create the slide HTML up to where the slide content goes"""
+    if section:
+        return SLIDE_HEAD_SECTION_TEMPLATE.format(title=title, section=section)
+    return SLIDE_HEAD_NO_SECTION_TEMPLATE.format(title=title)
+
+def create_slide_template(title: str, content: str, section: Optional[str] = None) -> str:
+    """Create a basic slide HTML template"""
+    return create_slide_head(title, section) + content + SLIDE_HTML_SUFFIX
+
+def scan_slide_files(slides_dir: Path) -> Tuple[List[tuple], List[str]]:
+    """Return sorted (filename, path, number, title_slug) tuples for the slide files in slides_dir,
+    plus the names of other HTML files that were skipped"""
+    slide_files = []
+    skipped_files = []
+    with os.scandir(slides_dir) as entries:
+        for entry in entries:
+            # The pattern is anchored on \.html$ and a 3-digit prefix, so it
+            # also rules out index.html and other non-slide files
+            match = SLIDE_PATTERN.match(entry.name)
+            if match:
+                if entry.is_file():
+                    slide_files.append((entry.name, entry.path, *match.groups()))
+            elif entry.name.endswith('.html') and entry.name != 'index.html':
+                skipped_files.append(entry.name)
     
-    # Get all HTML files that match the pattern
-    html_files = [f for f in os.listdir(slides_dir) if f.endswith('.html') and f != 'index.html']
+    for filename in sorted(skipped_files):
+        click.echo(f"⚠️  Skipping {filename} - doesn't match pattern XXX-title.html")
     
-    if not html_files:
-        click.echo(f"⚠️  No HTML files found in {slides_dir}", err=True)
-        return []
+    slide_files.sort(key=itemgetter(0))
+    return slide_files, skipped_files
+
+def read_slide_metadata(filename: str, filepath: str, number: str, title_slug: str, read_files: bool = True) -> Dict:
+    """Extract metadata for a single slide file"""
+    # Convert slug back to title, turning only whole-word 'and' into '&'
+    title = ' '.join('&' if word == 'and' else word.capitalize() for word in title_slug.split('-'))
     
-    html_files.sort()  # Sort by filename
+    if not read_files:
+        # Trust the naming convention: Main slides are numbered 001-010
+        return {
+            'number': number,
+            'title': title,
+            'filename': filename,
+            'section': "Appendix" if int(number) > 10 else "Main"
+        }
     
-    for filename in html_files:
-        match = slide_pattern.match(filename)
-        if match:
-            number = match.group(1)
-            title_slug = match.group(2)
-            
-            # Convert slug back to title
-            title = title_slug.replace('-', ' ').replace('and', '&').title()
+    # Read the file to extract actual title and section
+    try:
+        with open(filepath, 'r', encoding='utf-8') as f:
+            content = f.read(HEAD_READ_SIZE)
             
-            # Read the file to extract actual title and section
-            filepath = slides_dir / filename
-            try:
-                with open(filepath, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                    
-                # Extract title from HTML
-                title_match = re.search(r'<title>.*?-\s*(.+?)</title>', content)
-                if title_match:
-                    title = title_match.group(1)
-                
-                # Check if it's an appendix slide
-                section = "Appendix" if "Appendix" in content else "Main"
-                
-                slides.append({
-                    'number': number,
-                    'title': title,
-                    'filename': filename,
-                    'section': section
-                })
-                
-            except Exception as e:
-                click.echo(f"⚠️  Warning: Could not read {filename}: {e}", err=True)
-                # Fallback to derived info
-                slides.append({
-                    'number': number,
-                    'title': title,
-                    'filename': filename,
-                    'section': "Appendix" if int(number) > 10 else "Main"
-                })
-        else:
-            click.echo(f"⚠️  Skipping {filename} - doesn't match pattern XXX-title.html")
-    
-    return slides
+            # The section badge follows the container's opening tag,
+            # so read just past it instead of the whole slide body
+            body_start = content.find(SLIDE_CONTAINER_TAG)
+            while body_start < 0 or len(content) < body_start + SECTION_BADGE_WINDOW:
+                chunk = f.read(HEAD_READ_SIZE)
+                if not chunk:
+                    break
+                content += chunk
+                if body_start < 0:
+                    body_start = content.find(SLIDE_CONTAINER_TAG)
+        
+        # Extract title from everything read, so a long head still finds it
+        title_match = TITLE_PATTERN.search(content)
+        if title_match:
+            title = title_match.group(1)
+        
+        # Check if it's an appendix slide
+        section = "Appendix" if "Appendix" in content else "Main"
+        
+        return {
+            'number': number,
+            'title': title,
+            'filename': filename,
+            'section': section
+        }
+        
+    except Exception as e:
+        click.echo(f"⚠️  Warning: Could not read {filename}: {e}", err=True)
+        # Fallback to derived info
+        return {
+            'number': number,
+            'title': title,
+            'filename': filename,
+            'section': "Appendix" if int(number) > 10 else "Main"
+        }
 
-def create_navigation_html(slides: List[Dict], page_title: str, slides_dir: Path) -> str:
-    """Create the main navigation HTML"""
-    # Create sidebar items
-    sidebar_items = []
-    current_section = None
-    
-    # Determine relative path from navigation file to slides directory
-    slides_dir_name = slides_dir.name if slides_dir.name != '.' else ''
-    slides_path_prefix = f"{slides_dir_name}/" if slides_dir_name else ""
+def slide_files_signature(slide_files: List[tuple]) -> List[list]:
+    """Return a per-file [filename, size, mtime_ns, ctime_ns] fingerprint, without opening the files"""
+    signature = []
+    for filename, filepath, *_ in slide_files:
+        stat = os.stat(filepath)
+        # mv and cp -p keep the mtime but always bump the ctime
+        signature.append([filename, stat.st_size, stat.st_mtime_ns, stat.st_ctime_ns])
+    return signature
+
+def load_cached_slides(slides_dir: Path, signature: List[list]) -> Optional[List[Dict]]:
+    """Return the slides saved in the metadata file if they were read under the same signature"""
+    try:
+        metadata = json.loads((slides_dir / SLIDE_METADATA_FILENAME).read_bytes())
+        if metadata.get('_sig') != signature:
+            return None
+        return metadata['slides']
+    except (OSError, ValueError, KeyError, TypeError, AttributeError):
+        return None
+
+def discover_slides(slides_dir: Path, slide_files: Optional[List[tuple]] = None, read_files: bool = True) -> Tuple[List[Dict], Counter, Optional[List[list]]]:
+    """Discover all slide files and extract metadata, plus slide counts per section and the
+    file signature the metadata was read under (None when titles come from filenames)"""
+    # Get all slide files (XXX-title.html); a missing directory surfaces
+    # from scandir itself, so it costs no separate existence check
+    if slide_files is None:
+        try:
+            slide_files, _ = scan_slide_files(slides_dir)
+        except FileNotFoundError:
+            click.echo(f"❌ Directory {slides_dir} does not exist!", err=True)
+            return [], Counter(), None
     
-    for i, slide in enumerate(slides):
-        section = slide['section']
-        
-        if section != current_section:
-            if current_section is not None:
-                sidebar_items.append('</div>')
-            sidebar_items.append(f'<div class="section"><h3>{section}</h3>')
-            current_section = section
-        
-        active_class = "active" if i == 0 else ""
-        slide_path = f"{slides_path_prefix}{slide['filename']}"
-        sidebar_items.append(f'''
-            <div class="slide-item {active_class}" onclick="loadSlide('{slide_path}', {i})">
-                {slide["number"]}. {slide["title"]}
-            </div>
-        ''')
+    if not slide_files:
+        click.echo(f"⚠️  No slide files found in {slides_dir}", err=True)
+        return [], Counter(), None
     
-    if current_section is not None:
-        sidebar_items.append('</div>')
+    # Fingerprint the files before reading them, so a slide saved mid-read
+    # can't have its old metadata stored under its new fingerprint
+    signature = None
+    if read_files:
+        try:
+            signature = slide_files_signature(slide_files)
+        except OSError:
+            pass  # a slide vanished since the scan; read_slide_metadata reports it
     
-    sidebar_html = ''.join(sidebar_items)
+    # Unchanged decks are served from the saved metadata without opening any slide
+    slides = load_cached_slides(slides_dir, signature) if signature is not None else None
+    if slides is not None:
+        return slides, Counter(map(itemgetter('section'), slides)), signature
     
-    # Get first slide filename for initial load with proper path
-    first_slide = f"{slides_path_prefix}{slides[0]['filename']}" if slides else 'index.html'
+    if read_files:
+        # Reading slides is I/O bound, so overlap the file reads across
+        # threads; map() returns the results in filename order
+        with ThreadPoolExecutor(max_workers=min(32, len(slide_files))) as executor:
+            slides = list(executor.map(lambda slide_file: read_slide_metadata(*slide_file), slide_files))
+    else:
+        slides = [read_slide_metadata(*slide_file, read_files=False) for slide_file in slide_files]
     
-    return f'''<!DOCTYPE html>
+    return slides, Counter(map(itemgetter('section'), slides)), signature
+
+NAVIGATION_HEAD_TEMPLATE = '''<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
@@ -489,12 +600,14 @@ def create_navigation_html(slides: List[Dict], page_title: str, slides_dir: Path
     <div class="container">
         <div class="sidebar">
             <h2>🚀 {page_title}</h2>
-            {sidebar_html}
+            '''
+
+NAVIGATION_CONTROLS_TEMPLATE = '''
         </div>
         
         <div class="main-content">
             <div class="slide-counter">
-                <span id="current-slide">1</span> / {len(slides)}
+                <span id="current-slide">1</span> / {total}
             </div>
             
             <iframe id="slide-frame" class="slide-frame" src="{first_slide}"></iframe>
@@ -503,7 +616,7 @@ def create_navigation_html(slides: List[Dict], page_title: str, slides_dir: Path
                 <button class="nav-btn" id="first-btn" onclick="goToSlide(0)">&lt;&lt;</button>
                 <button class="nav-btn" id="prev-btn" onclick="previousSlide()">&lt;</button>
                 <button class="nav-btn" id="next-btn" onclick="nextSlide()">&gt;</button>
-                <button class="nav-btn" id="last-btn" onclick="goToSlide({len(slides) - 1})">&gt;&gt;</button>
+                <button class="nav-btn" id="last-btn" onclick="goToSlide({last_index})">&gt;&gt;</button>
                 <button class="nav-btn pdf-btn" id="pdf-btn" onclick="generatePDF()" title="Generate PDF">📄 PDF</button>
             </div>
         </div>
@@ -525,8 +638,9 @@ def create_navigation_html(slides: List[Dict], page_title: str, slides_dir: Path
     </style>
     
     <script>
-        const slides = {json.dumps([f"{slides_path_prefix}{slide['filename']}" for slide in slides])};
-        const slideFilenames = {json.dumps([slide['filename'] for slide in slides])};
+        const slideFilenames = '''
+
+NAVIGATION_SCRIPT_TEMPLATE = ''';
         let currentSlideIndex = 0;
         
         function loadSlide(slidePathWithPrefix, index) {{
@@ -616,7 +730,7 @@ def create_navigation_html(slides: List[Dict], page_title: str, slides_dir: Path
                     const url = window.URL.createObjectURL(blob);
                     const a = document.createElement('a');
                     a.href = url;
-                    a.download = '{page_title.lower().replace(" ", "_")}_slides.pdf';
+                    a.download = '{pdf_name}_slides.pdf';
                     document.body.appendChild(a);
                     a.click();
                     window.URL.revokeObjectURL(url);
@@ -641,14 +755,67 @@ def create_navigation_html(slides: List[Dict], page_title: str, slides_dir: Path
 </body>
 </html>'''
 
-def save_slide_metadata(slides: List[Dict], output_dir: Path) -> None:
-    """Save slide metadata to JSON for easy reference"""
+SIDEBAR_ITEM_TEMPLATE = '''
+            <div class="slide-item {active}" onclick="loadSlide('{path}', {index})">
+                {number}. {title}
+            </div>
+        '''
+
+def iter_navigation_html(slides: List[Dict], page_title: str, slides_dir: Path) -> Iterator[str]:
+    """Yield the main navigation HTML in chunks, ready for writelines()"""
+    # Determine relative path from navigation file to slides directory
+    slides_dir_name = slides_dir.name if slides_dir.name != '.' else ''
+    slides_path_prefix = f"{slides_dir_name}/" if slides_dir_name else ""
+    
+    yield NAVIGATION_HEAD_TEMPLATE.format(page_title=page_title)
+    
+    # Create sidebar items, one section block per run of consecutive slides
+    # sharing a section (slides keep their file order)
+    for section, group in groupby(enumerate(slides), key=lambda item: item[1]['section']):
+        items = ''.join(
+            SIDEBAR_ITEM_TEMPLATE.format(
+                active="active" if i == 0 else "",
+                path=slides_path_prefix + slide['filename'],
+                index=i,
+                number=slide['number'],
+                title=slide['title']
+            )
+            for i, slide in group
+        )
+        yield f'<div class="section"><h3>{section}</h3>{items}</div>'
+    
+    # Get first slide filename for initial load with proper path
+    first_slide = f"{slides_path_prefix}{slides[0]['filename']}" if slides else 'index.html'
+    
+    yield NAVIGATION_CONTROLS_TEMPLATE.format(
+        total=len(slides),
+        first_slide=first_slide,
+        last_index=len(slides) - 1
+    )
+    # Encode the filenames once; the page derives the prefixed slide paths
+    yield json.dumps([slide['filename'] for slide in slides], separators=(',', ':'))
+    yield f';\n        const slides = slideFilenames.map(filename => {json.dumps(slides_path_prefix)} + filename)'
+    yield NAVIGATION_SCRIPT_TEMPLATE.format(
+        page_title=page_title,
+        pdf_name=page_title.lower().replace(" ", "_")
+    )
+
+def create_navigation_html(slides: List[Dict], page_title: str, slides_dir: Path) -> str:
+    """Create the main navigation HTML"""
+    return ''.join(iter_navigation_html(slides, page_title, slides_dir))
+
+def save_slide_metadata(slides: List[Dict], output_dir: Path, pretty: bool = False, signature: Optional[List[list]] = None) -> None:
+    """Save slide metadata to JSON (indented only when pretty is set)"""
     metadata = {
         'total_slides': len(slides),
         'slides': slides,
         'sections': {}
     }
     
+    # Lets discover_slides reuse this file while the slide files are unchanged
+    if signature is not None:
+        metadata['_sig'] = signature
+    
     # Group by section
     for slide in slides:
         section = slide['section']
@@ -656,98 +823,147 @@ def save_slide_metadata(slides: List[Dict], output_dir: Path) -> None:
             metadata['sections'][section] = []
         metadata['sections'][section].append(slide)
     
-    metadata_file = output_dir / 'slides_metadata.json'
-    with open(metadata_file, 'w', encoding='utf-8') as f:
-        json.dump(metadata, f, indent=2)
+    metadata_file = output_dir / SLIDE_METADATA_FILENAME
+    if ORJSON_AVAILABLE:
+        metadata_bytes = orjson.dumps(metadata, option=orjson.OPT_INDENT_2 if pretty else 0)
+    elif pretty:
+        metadata_bytes = json.dumps(metadata, indent=2).encode('utf-8')
+    else:
+        metadata_bytes = json.dumps(metadata, separators=(',', ':')).encode('utf-8')
+    metadata_file.write_bytes(metadata_bytes)
     
     click.echo(f"📄 Saved metadata to: {metadata_file}")
 
+def read_slide_file(slide_path: Path) -> Optional[bytes]:
+    """Read a slide file's raw bytes, or return None if it does not exist"""
+    try:
+        return slide_path.read_bytes()
+    except FileNotFoundError:
+        return None
+
+async def read_slide_files(slide_paths: List[Path]) -> List[Optional[bytes]]:
+    """Read slide files concurrently in worker threads, keeping the event loop free"""
+    return await asyncio.gather(*(asyncio.to_thread(read_slide_file, slide_path) for slide_path in slide_paths))
+
+def extract_slide_body(slide_content: bytes) -> Optional[str]:
+    """Return the decoded inner HTML of the slide container, or None if there is none"""
+    # Slides written by create_slide_template mark their body explicitly
+    start = slide_content.find(SLIDE_BODY_START_BYTES)
+    if start >= 0:
+        start += len(SLIDE_BODY_START_BYTES)
+        end = slide_content.find(SLIDE_BODY_END_BYTES, start)
+        if end >= 0:
+            return slide_content[start:end].decode('utf-8')
+    
+    # Older slides: byte-level scans: skip the container's opening tag, then take the
+    # first </body> whose preceding markup (ignoring whitespace) is the
+    # container's closing </div>; only the body itself is ever decoded
+    start = slide_content.find(SLIDE_CONTAINER_TAG_BYTES)
+    if start < 0:
+        return None
+    start = slide_content.find(b'>', start) + 1
+    if not start:
+        return None
+    
+    body_end = slide_content.find(b'</body>', start)
+    while body_end >= 0:
+        end = body_end
+        while end > start and slide_content[end - 1] in ASCII_WHITESPACE:
+            end -= 1
+        if slide_content.endswith(b'</div>', start, end):
+            return slide_content[start:end - len(b'</div>')].decode('utf-8')
+        body_end = slide_content.find(b'</body>', body_end + len(b'</body>'))
+    return None
+
 async def generate_pdf_playwright(slides_dir: Path, slides: List[Dict], output_file: Path, page_title: str) -> None:
     """Generate PDF using Playwright (recommended method)"""
     if not PLAYWRIGHT_AVAILABLE:
         raise ImportError("Playwright not available. Install with: pip install playwright && playwright install")
     
-    async with async_playwright() as p:
-        browser = await p.chromium.launch()
-        page = await browser.new_page()
+    click.echo("🖨️  Generating PDF pages...")
+    
+    # Create a combined HTML document with all slides
+    html_parts = [f"""
+    <!DOCTYPE html>
+    <html>
+    <head>
+        <title>{page_title}</title>
+        <style>
+            @page {{
+                size: A4;
+                margin: 0.5in;
+            }}
+            .slide-page {{
+                page-break-after: always;
+                min-height: 100vh;
+            }}
+            .slide-page:last-child {{
+                page-break-after: avoid;
+            }}
+            body {{
+                margin: 0;
+                padding: 0;
+            }}
+        </style>
+    </head>
+    <body>
+    """]
+    
+    # Read all slides up front, concurrently
+    slide_paths = [slides_dir / slide['filename'] for slide in slides]
+    slide_contents = await read_slide_files(slide_paths)
+    
+    extracted_slides = 0
+    for i, (slide, slide_path, slide_content) in enumerate(zip(slides, slide_paths, slide_contents)):
+        if slide_content is None:
+            click.echo(f"⚠️  Warning: {slide_path} not found, skipping...")
+            continue
         
-        click.echo("🖨️  Generating PDF pages...")
-        
-        # Create a combined HTML document with all slides
-        combined_html = f"""
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <title>{page_title}</title>
-            <style>
-                @page {{
-                    size: A4;
-                    margin: 0.5in;
-                }}
-                .slide-page {{
-                    page-break-after: always;
-                    min-height: 100vh;
-                }}
-                .slide-page:last-child {{
-                    page-break-after: avoid;
-                }}
-                body {{
-                    margin: 0;
-                    padding: 0;
-                }}
-            </style>
-        </head>
-        <body>
-        """
+        click.echo(f"   Processing slide {i+1}/{len(slides)}: {slide['title']}")
         
-        for i, slide in enumerate(slides):
-            slide_path = slides_dir / slide['filename']
-            
-            if not slide_path.exists():
-                click.echo(f"⚠️  Warning: {slide_path} not found, skipping...")
-                continue
-            
-            click.echo(f"   Processing slide {i+1}/{len(slides)}: {slide['title']}")
-            
-            # Read slide content
-            with open(slide_path, 'r', encoding='utf-8') as f:
-                slide_content = f.read()
-            
-            # Extract the slide container content
-            container_match = re.search(r'<div class="slide-container"[^>]*>(.*?)</div>\s*</body>', slide_content, re.DOTALL)
-            if container_match:
-                slide_body = container_match.group(1)
-                
-                # Add slide to combined HTML
-                combined_html += f"""
-                <div class="slide-page">
-                    <div class="slide-container" style="
-                        max-width: 1000px;
-                        margin: 0 auto;
-                        background: white;
-                        border-radius: 15px;
-                        box-shadow: 0 10px 30px rgba(0,0,0,0.2);
-                        padding: 40px;
-                        min-height: 600px;
-                        font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
-                        line-height: 1.6;
-                        color: #333;
-                    ">
-                        {slide_body}
-                    </div>
+        # Extract the slide container content
+        slide_body = extract_slide_body(slide_content)
+        if slide_body is not None:
+            extracted_slides += 1
+            # Add slide to combined HTML
+            html_parts.append(f"""
+            <div class="slide-page">
+                <div class="slide-container" style="
+                    max-width: 1000px;
+                    margin: 0 auto;
+                    background: white;
+                    border-radius: 15px;
+                    padding: 40px;
+                    min-height: 600px;
+                    font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
+                    line-height: 1.6;
+                    color: #333;
+                ">
+                    {slide_body}
                 </div>
-                """
-            else:
-                click.echo(f"⚠️  Warning: Could not extract content from {slide['filename']}")
-        
-        combined_html += """
-        </body>
-        </html>
-        """
+            </div>
+            """)
+        else:
+            click.echo(f"⚠️  Warning: Could not extract content from {slide['filename']}")
+    
+    html_parts.append("""
+    </body>
+    </html>
+    """)
+    combined_html = ''.join(html_parts)
+    
+    # Fail before paying for a Chromium launch when there is nothing to print
+    if not extracted_slides:
+        raise ValueError("No slide content could be extracted; nothing to render")
+    
+    from playwright.async_api import async_playwright
+    
+    async with async_playwright() as p:
+        browser = await p.chromium.launch(args=CHROMIUM_LAUNCH_ARGS)
+        page = await browser.new_page()
         
         # Generate PDF from combined HTML
-        await page.set_content(combined_html)
-        await page.wait_for_load_state('networkidle')
+        await page.set_content(combined_html, wait_until='load')
         
         # Generate single PDF with all slides
         pdf_bytes = await page.pdf(
@@ -771,58 +987,103 @@ async def generate_pdf_playwright(slides_dir: Path, slides: List[Dict], output_f
         click.echo(f"✅ PDF generated with {len(slides)} slides: {output_file}")
 
 async def generate_pdf_playwright_alternative(slides_dir: Path, slides: List[Dict], output_file: Path, page_title: str) -> None:
-    """Alternative Playwright method: Generate individual PDFs and merge using PyPDF2"""
+    """Alternative Playwright method: Generate individual PDFs and merge using pypdf"""
     if not PLAYWRIGHT_AVAILABLE:
         raise ImportError("Playwright not available. Install with: pip install playwright && playwright install")
     
     try:
-        from PyPDF2 import PdfWriter, PdfReader
-        import io
-        PYPDF2_AVAILABLE = True
+        from pypdf import PdfWriter
     except ImportError:
-        PYPDF2_AVAILABLE = False
-        # Fall back to single HTML method
-        await generate_pdf_playwright(slides_dir, slides, output_file, page_title)
-        return
+        try:
+            # PyPDF2 is pypdf's former name; 3.x has the same append() API
+            from PyPDF2 import PdfWriter
+        except ImportError:
+            # Fall back to single HTML method
+            await generate_pdf_playwright(slides_dir, slides, output_file, page_title)
+            return
+    import io
+    
+    click.echo("🖨️  Generating individual PDF pages...")
+    
+    # Read all slides up front, concurrently, skipping missing ones so the
+    # workers only see renderable slides
+    slide_paths = [slides_dir / slide['filename'] for slide in slides]
+    slide_contents = await read_slide_files(slide_paths)
+    
+    jobs = []
+    for i, (slide, slide_path, slide_content) in enumerate(zip(slides, slide_paths, slide_contents)):
+        if slide_content is None:
+            click.echo(f"⚠️  Warning: {slide_path} not found, skipping...")
+            continue
+        
+        jobs.append((i, slide, slide_path, slide_content))
+    
+    # Fail before paying for a Chromium launch when there is nothing to print
+    if not jobs:
+        raise ValueError("None of the slide files exist; nothing to render")
+    
+    from playwright.async_api import async_playwright
     
     async with async_playwright() as p:
-        browser = await p.chromium.launch()
-        page = await browser.new_page()
+        browser = await p.chromium.launch(args=CHROMIUM_LAUNCH_ARGS)
         
-        click.echo("🖨️  Generating individual PDF pages...")
+        # Chromium rendering is CPU bound, so render on several browser
+        # contexts at once; the workers share one iterator over the jobs and
+        # store each PDF under its slide index to keep the deck order
+        slide_pdfs = [None] * len(slides)
+        pending_jobs = iter(jobs)
         
+        async def render_worker() -> None:
+            context = await browser.new_context()
+            try:
+                page = await context.new_page()
+                
+                for i, slide, slide_path, slide_content in pending_jobs:
+                    click.echo(f"   Processing slide {i+1}/{len(slides)}: {slide['title']}")
+                    
+                    # Self-contained slides are loaded straight from memory; ones
+                    # referencing other files need a file:// URL to resolve them
+                    if EXTERNAL_ASSET_PATTERN.search(slide_content):
+                        await page.goto(f"file://{slide_path.absolute()}", wait_until='load')
+                    else:
+                        await page.set_content(slide_content.decode('utf-8'), wait_until='load')
+                    await page.add_style_tag(content=PDF_STYLE_OVERRIDES)
+                    
+                    # Generate PDF for this slide
+                    slide_pdfs[i] = await page.pdf(
+                        format='A4',
+                        margin={
+                            'top': '0.5in',
+                            'bottom': '0.5in',
+                            'left': '0.5in',
+                            'right': '0.5in'
+                        },
+                        print_background=True,
+                        prefer_css_page_size=True
+                    )
+            finally:
+                await context.close()
+        
+        # On the first failure, cancel the other workers before the browser
+        # is torn down under them, then re-raise that failure
+        workers = [asyncio.create_task(render_worker()) for _ in range(min(PDF_RENDER_WORKERS, len(jobs)))]
+        try:
+            await asyncio.gather(*workers)
+        except BaseException:
+            for worker in workers:
+                worker.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+            raise
+        
+        # Merge the slide PDFs in deck order
         pdf_writer = PdfWriter()
         
-        for i, slide in enumerate(slides):
-            slide_path = slides_dir / slide['filename']
-            
-            if not slide_path.exists():
-                click.echo(f"⚠️  Warning: {slide_path} not found, skipping...")
+        for pdf_bytes in slide_pdfs:
+            if pdf_bytes is None:
                 continue
             
-            click.echo(f"   Processing slide {i+1}/{len(slides)}: {slide['title']}")
-            
-            # Navigate to slide
-            await page.goto(f"file://{slide_path.absolute()}")
-            await page.wait_for_load_state('networkidle')
-            
-            # Generate PDF for this slide
-            pdf_bytes = await page.pdf(
-                format='A4',
-                margin={
-                    'top': '0.5in',
-                    'bottom': '0.5in',
-                    'left': '0.5in',
-                    'right': '0.5in'
-                },
-                print_background=True,
-                prefer_css_page_size=True
-            )
-            
-            # Add to PDF writer
-            pdf_reader = PdfReader(io.BytesIO(pdf_bytes))
-            for page_num in range(len(pdf_reader.pages)):
-                pdf_writer.add_page(pdf_reader.pages[page_num])
+            # Add all pages of this slide to the PDF writer in one call
+            pdf_writer.append(io.BytesIO(pdf_bytes))
         
         await browser.close()
         
@@ -839,30 +1100,19 @@ def generate_pdf_weasyprint(slides_dir: Path, slides: List[Dict], output_file: P
     
     click.echo("🖨️  Generating PDF with WeasyPrint...")
     
-    # Create a combined HTML document
-    combined_html = f"""
-    <!DOCTYPE html>
-    <html>
-    <head>
-        <title>{page_title}</title>
-        <style>
-            @page {{
-                size: A4;
-                margin: 0.5in;
-            }}
-            .page-break {{
-                page-break-before: always;
-            }}
-            body {{
-                font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
-                line-height: 1.6;
-                color: #333;
-            }}
-        </style>
-    </head>
-    <body>
-    """
+    import weasyprint
+    try:
+        from weasyprint.text.fonts import FontConfiguration
+    except ImportError:  # WeasyPrint < 53
+        from weasyprint.fonts import FontConfiguration
     
+    # Font discovery and stylesheet parsing happen once for the whole deck
+    font_config = FontConfiguration()
+    base_css = weasyprint.CSS(string=WEASYPRINT_BASE_STYLES, font_config=font_config)
+    
+    # Lay out each slide on its own, then merge the rendered pages; every
+    # document starts on a fresh page so no page-break markup is needed
+    documents = []
     for i, slide in enumerate(slides):
         slide_path = slides_dir / slide['filename']
         
@@ -877,17 +1127,19 @@ def generate_pdf_weasyprint(slides_dir: Path, slides: List[Dict], output_file: P
             slide_content = f.read()
         
         # Extract body content
-        body_match = re.search(r'<body[^>]*>(.*?)</body>', slide_content, re.DOTALL)
+        body_match = BODY_PATTERN.search(slide_content)
         if body_match:
-            body_content = body_match.group(1)
-            page_break = "page-break" if i > 0 else ""
-            combined_html += f'<div class="{page_break}">{body_content}</div>\n'
+            slide_html = weasyprint.HTML(string=body_match.group(1), base_url=str(slides_dir))
+            documents.append(slide_html.render(stylesheets=[base_css], font_config=font_config))
     
-    combined_html += "</body></html>"
+    if not documents:
+        raise ValueError("No slide content could be extracted; nothing to render")
     
     # Generate PDF
     try:
-        weasyprint.HTML(string=combined_html).write_pdf(str(output_file))
+        combined_document = documents[0].copy([page for document in documents for page in document.pages])
+        combined_document.metadata.title = page_title
+        combined_document.write_pdf(str(output_file))
         click.echo(f"✅ PDF generated: {output_file}")
     except Exception as e:
         click.echo(f"❌ WeasyPrint error: {e}")
@@ -986,7 +1238,7 @@ def generate_pdf_command(
         return
     
     # Discover slides
-    slides = discover_slides(slides_dir)
+    slides, _, _ = discover_slides(slides_dir)
     
     if not slides:
         click.echo(f"❌ No valid slides found in {slides_dir}")
@@ -1010,13 +1262,17 @@ def generate_pdf_command(
             import traceback
             traceback.print_exc()
 
-def create_sample_slides(slides_dir: Path) -> None:
-    """Create a few sample slides to demonstrate the structure"""
-    sample_slides = [
-        {
-            'number': '001',
-            'title': 'Introduction to Prefect',
-            'content': '''
+def write_slide_file(filepath: str, slide_bytes: bytes) -> None:
+    """Write a rendered slide to disk in a single write"""
+    with open(filepath, 'wb') as f:
+        f.write(slide_bytes)
+
+# Built once at import; create_sample_slides only renders and writes them
+SAMPLE_SLIDES = (
+    {
+        'number': '001',
+        'title': 'Introduction to Prefect',
+        'content': '''
             <h1>🚀 Prefect</h1>
             <h2>Modern Workflow Orchestration</h2>
             <div class="slide-content">
@@ -1031,11 +1287,11 @@ def create_sample_slides(slides_dir: Path) -> None:
                 </div>
             </div>
             '''
-        },
-        {
-            'number': '002',
-            'title': 'Quick Setup',
-            'content': '''
+    },
+    {
+        'number': '002',
+        'title': 'Quick Setup',
+        'content': '''
             <h1>⚡ Quick Setup</h1>
             <div class="slide-content">
                 <h3>1. Installation</h3>
@@ -1065,12 +1321,12 @@ if __name__ == "__main__":
                 </div>
             </div>
             '''
-        },
-        {
-            'number': '011',
-            'title': 'Prefect vs Airflow',
-            'section': 'Appendix',
-            'content': '''
+    },
+    {
+        'number': '011',
+        'title': 'Prefect vs Airflow',
+        'section': 'Appendix',
+        'content': '''
             <h1>🆚 Prefect vs Apache Airflow</h1>
             <div class="slide-content">
                 <table class="comparison-table">
@@ -1101,23 +1357,27 @@ if __name__ == "__main__":
                 </table>
             </div>
             '''
-        }
-    ]
+    }
+)
+
+def create_sample_slides(slides_dir: Path) -> None:
+    """Create a few sample slides to demonstrate the structure"""
+    slides_dir = os.fspath(slides_dir)
     
-    for slide in sample_slides:
-        filename = f"{slide['number']}-{slide['title'].lower().replace(' ', '-').replace('&', 'and')}.html"
-        filepath = slides_dir / filename
-        
-        html_content = create_slide_template(
-            f"{slide['number']} - {slide['title']}", 
-            slide['content'],
-            slide.get('section')
-        )
-        
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write(html_content)
-        
-        click.echo(f"📄 Created sample slide: {filename}")
+    # Render every slide up front so the write loop below does no formatting
+    pending = []
+    for slide in SAMPLE_SLIDES:
+        filename = f"{slide['number']}-{slide['title'].casefold().translate(SLUG_TABLE)}.html"
+        slide_head = create_slide_head(f"{slide['number']} - {slide['title']}", slide.get('section'))
+        slide_bytes = b''.join((slide_head.encode('utf-8'), slide['content'].encode('utf-8'), SLIDE_HTML_SUFFIX_BYTES))
+        pending.append((filename, slide_bytes))
+    
+    # Overlap the file writes across threads (the GIL is released during
+    # the write syscalls), then report them all with a single echo
+    with ThreadPoolExecutor(max_workers=min(32, len(pending))) as executor:
+        list(executor.map(lambda item: write_slide_file(os.path.join(slides_dir, item[0]), item[1]), pending))
+    
+    click.echo('\n'.join(f"📄 Created sample slide: {filename}" for filename, _ in pending))
 
 @click.command()
 @click.option(
@@ -1150,6 +1410,11 @@ if __name__ == "__main__":
     is_flag=True,
     help='Generate slides metadata JSON file'
 )
+@click.option(
+    '--titles-from-filenames',
+    is_flag=True,
+    help='Derive titles and sections from filenames without reading slide files'
+)
 @click.option(
     '--verbose',
     '-v',
@@ -1162,6 +1427,7 @@ def generate_navigation(
     output: Optional[Path],
     create_samples: bool,
     metadata: bool,
+    titles_from_filenames: bool,
     verbose: bool
 ) -> None:
     """
@@ -1189,23 +1455,27 @@ def generate_navigation(
     if output is None:
         output = slides_dir / 'index.html'
     
-    # Ensure slides directory exists
-    slides_dir.mkdir(exist_ok=True)
-    
     if verbose:
         click.echo(f"🔍 Looking for slides in: {slides_dir}")
         click.echo(f"📝 Page title: {title}")
         click.echo(f"📄 Output file: {output}")
     
-    # Check if slides exist, create samples if requested and directory is empty
-    existing_slides = [f for f in os.listdir(slides_dir) if f.endswith('.html') and f != 'index.html']
+    # Check if slides exist, create samples if requested and directory is empty;
+    # the scan itself reports a missing directory, which is only then created
+    try:
+        slide_files, skipped_files = scan_slide_files(slides_dir)
+    except FileNotFoundError:
+        slides_dir.mkdir(exist_ok=True)
+        slide_files, skipped_files = [], []
     
-    if not existing_slides and create_samples:
+    # Non-matching HTML files still count: samples never go into a used directory
+    if not slide_files and not skipped_files and create_samples:
         click.echo("📝 No slides found. Creating sample slides...")
         create_sample_slides(slides_dir)
+        slide_files, _ = scan_slide_files(slides_dir)
     
-    # Discover all slides
-    slides = discover_slides(slides_dir)
+    # Discover all slides from the same directory scan
+    slides, sections, signature = discover_slides(slides_dir, slide_files, read_files=not titles_from_filenames)
     
     if not slides:
         click.echo("❌ No valid slides found! Use --create-samples to generate examples.", err=True)
@@ -1217,28 +1487,24 @@ def generate_navigation(
         for slide in slides:
             click.echo(f"  {slide['number']}. {slide['title']} ({slide['section']})")
     
-    # Generate navigation index
-    navigation_html = create_navigation_html(slides, title, slides_dir)
-    
-    with open(output, 'w', encoding='utf-8') as f:
-        f.write(navigation_html)
+    # Generate navigation index into a temp file that replaces the output
+    # once complete, so an interrupted run never leaves a truncated page
+    with click.open_file(os.fspath(output), 'wb', atomic=True) as f:
+        f.writelines(chunk.encode('utf-8') for chunk in iter_navigation_html(slides, title, slides_dir))
     
     click.echo(f"\n✅ Generated navigation: {output}")
     
     # Save metadata if requested
     if metadata:
-        save_slide_metadata(slides, slides_dir)
+        # signature is None for titles derived from filenames, which must
+        # not be reused as read ones
+        save_slide_metadata(slides, slides_dir, pretty=verbose, signature=signature)
     
     # Success message
     click.echo(f"\n🚀 Success! Open {output} in your browser to view the presentation.")
     click.echo(f"📋 Found {len(slides)} slides total")
     
     # Show section breakdown
-    sections = {}
-    for slide in slides:
-        section = slide['section']
-        sections[section] = sections.get(section, 0) + 1
-    
     for section, count in sections.items():
         click.echo(f"   • {section}: {count} slides")
 
@@ -1261,18 +1527,18 @@ def create_slide(title: str, content_file, number: str, section: Optional[str],
     number = f"{int(number):03d}"
     
     # Generate filename
-    filename = f"{number}-{title.lower().replace(' ', '-').replace('&', 'and')}.html"
-    
-    # Create output directory
-    output_dir.mkdir(exist_ok=True)
+    filename = f"{number}-{title.casefold().translate(SLUG_TABLE)}.html"
     
     # Generate HTML
     html_content = create_slide_template(f"{number} - {title}", content, section)
     
-    # Write file
+    # Write file, creating the output directory only if it is missing
     filepath = output_dir / filename
-    with open(filepath, 'w', encoding='utf-8') as f:
-        f.write(html_content)
+    try:
+        filepath.write_bytes(html_content.encode('utf-8'))
+    except FileNotFoundError:
+        output_dir.mkdir(exist_ok=True)
+        filepath.write_bytes(html_content.encode('utf-8'))
     
     click.echo(f"✅ Created slide: {filepath}")
 